@@ -8,9 +8,15 @@ environment setup and error handling.
 
 import sys
 import os
+import asyncio
 import subprocess
 from pathlib import Path
 
+# Add src to Python path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from core._pac_version_cache import get_pac_version, pac_check_skipped
+
 def check_python_version():
     """Check if Python version is compatible."""
     if sys.version_info < (3, 8):
@@ -30,17 +36,16 @@ def check_dependencies():
         print("  pip install -r requirements.txt")
         return False
 
-def check_pac_cli():
+def check_pac_cli(force_refresh=False):
     """Check if PAC CLI is available."""
+    if pac_check_skipped():
+        print("✓ PAC CLI check skipped (POWER_PLATFORM_SKIP_PAC_CHECK)")
+        return True
+    
     try:
-        result = subprocess.run(
-            ["pac", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if result.returncode == 0:
-            print(f"✓ PAC CLI found: {result.stdout.strip()}")
+        version = get_pac_version(force_refresh=force_refresh)
+        if version is not None:
+            print(f"✓ PAC CLI found: {version}")
             return True
         else:
             print("✗ PAC CLI not accessible")
@@ -50,21 +55,38 @@ def check_pac_cli():
         print("  winget install Microsoft.PowerPlatformCLI")
         return False
 
+def run_startup_checks(force_refresh=False):
+    """Run the dependency and PAC CLI checks concurrently."""
+    async def gather_checks():
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(
+            loop.run_in_executor(None, check_dependencies),
+            loop.run_in_executor(None, check_pac_cli, force_refresh)
+        )
+    
+    return asyncio.run(gather_checks())
+
 def main():
     """Main launch function."""
     print("Power Platform Utility - Launch Script")
     print("=" * 50)
     
+    # Re-run `pac --version` instead of trusting the cached result
+    no_cache = "--no-cache" in sys.argv
+    if no_cache:
+        sys.argv.remove("--no-cache")
+    
     # Check Python version
     if not check_python_version():
         sys.exit(1)
     
-    # Check dependencies
-    if not check_dependencies():
+    # Check dependencies and PAC CLI (optional but recommended) in parallel
+    deps_ok, pac_ok = run_startup_checks(force_refresh=no_cache)
+    
+    if not deps_ok:
         sys.exit(1)
     
-    # Check PAC CLI (optional but recommended)
-    if not check_pac_cli():
+    if not pac_ok:
         print("\nWarning: PAC CLI not found. Some features may not work.")
         response = input("Continue anyway? (y/N): ").lower()
         if response != 'y':
@@ -76,10 +98,6 @@ def main():
     
     # Launch the application
     try:
-        # Add src to Python path
-        src_path = Path(__file__).parent / "src"
-        sys.path.insert(0, str(src_path))
-        
         # Import and run main
         from main import main as app_main
         app_main()
@@ -0,0 +1,108 @@
+"""
+PAC CLI Version Cache Module
+
+This module remembers the output of `pac --version` on disk so repeated
+launches can skip spawning the PAC CLI just to confirm it is installed.
+The cache entry is keyed by the resolved `pac` executable path and its
+modification time, so upgrading or moving PAC CLI invalidates it.
+
+Environment variables:
+    POWER_PLATFORM_SKIP_PAC_CHECK: When set to a non-empty value, the
+        installation checks succeed without looking for PAC CLI at all.
+    POWER_PLATFORM_PAC_VERSION: When set, used as the PAC CLI version
+        instead of running `pac --version` or consulting the cache.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+
+def pac_check_skipped() -> bool:
+    """Check whether PAC CLI installation checks are disabled."""
+    return bool(os.environ.get("POWER_PLATFORM_SKIP_PAC_CHECK"))
+
+
+def _cache_file() -> Path:
+    """Get the path of the PAC CLI version cache file."""
+    if os.name == 'nt':  # Windows
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+        return Path(base) / "PowerPlatformUtility" / "cache" / "pac_version.json"
+
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), ".cache")
+    return Path(base) / "power-platform-utility" / "pac_version.json"
+
+
+def _read_cache(cache_file: Path, pac_path: str, mtime_ns: int) -> Optional[str]:
+    """Return the cached version if it matches the given executable."""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if entry.get("path") == pac_path and entry.get("mtime_ns") == mtime_ns:
+        return entry.get("version")
+    return None
+
+
+def _write_cache(cache_file: Path, pac_path: str, mtime_ns: int, version: str) -> None:
+    """Atomically write a cache entry, ignoring filesystem errors."""
+    entry = {"path": pac_path, "mtime_ns": mtime_ns, "version": version}
+    tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def get_pac_version(force_refresh: bool = False, timeout: int = 10) -> Optional[str]:
+    """
+    Get the installed PAC CLI version, using the on-disk cache when valid.
+
+    Args:
+        force_refresh: Ignore any cached value and spawn `pac --version`
+        timeout: Timeout in seconds for the `pac --version` call
+
+    Returns:
+        The version string, or None if PAC CLI is installed but not accessible
+
+    Raises:
+        FileNotFoundError: If PAC CLI is not installed
+        subprocess.TimeoutExpired: If `pac --version` timed out
+    """
+    version = os.environ.get("POWER_PLATFORM_PAC_VERSION")
+    if version:
+        return version
+
+    pac_path = shutil.which("pac")
+    if pac_path is None:
+        raise FileNotFoundError("pac")
+
+    cache_file = _cache_file()
+    mtime_ns = os.stat(pac_path).st_mtime_ns
+
+    if not force_refresh:
+        version = _read_cache(cache_file, pac_path, mtime_ns)
+        if version:
+            return version
+
+    result = subprocess.run(
+        [pac_path, "--version"],
+        capture_output=True,
+        text=True,
+        timeout=timeout
+    )
+    if result.returncode != 0:
+        return None
+
+    version = result.stdout.strip()
+    _write_cache(cache_file, pac_path, mtime_ns, version)
+    return version
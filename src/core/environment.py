@@ -4,13 +4,94 @@ Environment Management Module
 This module handles Power Platform environment operations and data management.
 """
 
+import asyncio
+import functools
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime
-from dataclasses import dataclass
+import operator
+import re
+import sys
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Any, Set, Tuple
+from datetime import datetime, timezone
+from dataclasses import dataclass, field
 
+from utils.compat import DATACLASS_SLOTS
 
-@dataclass
+
+# ISO-8601 timestamps as returned by PAC CLI, e.g. 2023-05-01T12:34:56.789Z
+_ISO_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?Z?$")
+
+# Datetime formats tried when the ISO-8601 fast paths do not match
+_DATETIME_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%d %H:%M:%S"
+)
+
+# Compile each format into strptime's internal regex cache up front
+for _fmt in _DATETIME_FORMATS:
+    try:
+        datetime.strptime("2000-01-01T00:00:00Z", _fmt)
+    except ValueError:
+        pass
+del _fmt
+
+# Python 3.11+ parses full ISO-8601, including the Z suffix, in C
+_fast_parse = datetime.fromisoformat if sys.version_info >= (3, 11) else None
+
+# Fields counted by the environment summary, fetched in a single C-level call
+_summary_getter = operator.attrgetter("environment_type", "region", "state")
+
+# Environment count above which search_environments uses a trigram index
+_TRIGRAM_THRESHOLD = 10000
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_datetime_cached(date_string: str) -> Optional[datetime]:
+    """Parse a datetime string, memoized since environment lists repeat timestamps."""
+    if _fast_parse is not None:
+        try:
+            parsed = _fast_parse(date_string)
+        except ValueError:
+            pass
+        else:
+            # Keep returning naive UTC datetimes, as the strptime formats do
+            if parsed.tzinfo is not None:
+                parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+            return parsed
+    
+    match = _ISO_RE.match(date_string)
+    if match:
+        year, month, day, hour, minute, second, fraction = match.groups()
+        try:
+            return datetime(
+                int(year), int(month), int(day),
+                int(hour), int(minute), int(second),
+                int((fraction or "0")[:6].ljust(6, "0"))
+            )
+        except ValueError:
+            pass
+    
+    # Fall back to other common datetime formats
+    for fmt in _DATETIME_FORMATS:
+        try:
+            return datetime.strptime(date_string, fmt)
+        except ValueError:
+            continue
+    
+    logging.getLogger(__name__).warning(f"Could not parse datetime: {date_string}")
+    return None
+
+
+def _pac_text(value: Any) -> str:
+    """Return a PAC CLI record field as text, whatever JSON type it came as."""
+    if isinstance(value, str):
+        return value
+    return '' if value is None else str(value)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class PowerPlatformEnvironment:
     """Data class representing a Power Platform environment."""
     
@@ -22,8 +103,30 @@ class PowerPlatformEnvironment:
     state: str
     created_time: Optional[datetime] = None
     
+    # Lowercased copies of the searchable fields, computed once
+    name_lc: str = field(init=False, repr=False, compare=False)
+    display_lc: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "name_lc", self.name.lower())
+        object.__setattr__(self, "display_lc", self.display_name.lower())
+    
     def __str__(self) -> str:
         return f"{self.display_name} ({self.name})"
+    
+    @classmethod
+    def from_pac(cls, record: Dict[str, Any]) -> "PowerPlatformEnvironment":
+        """Create an environment from a PAC CLI `org list` record."""
+        created_time = record.get('CreatedTime')
+        return cls(
+            name=_pac_text(record.get('EnvironmentName')),
+            display_name=_pac_text(record.get('FriendlyName')),
+            url=_pac_text(record.get('EnvironmentUrl')),
+            region=_pac_text(record.get('Region')),
+            environment_type=_pac_text(record.get('EnvironmentType')),
+            state=_pac_text(record.get('State')),
+            created_time=_parse_datetime_cached(created_time) if isinstance(created_time, str) and created_time else None
+        )
 
 
 class EnvironmentManager:
@@ -35,62 +138,105 @@ class EnvironmentManager:
         self.pac_cli = pac_cli_wrapper
         self.logger = logging.getLogger(__name__)
         self._environments: List[PowerPlatformEnvironment] = []
+        self._env_tuple: Tuple[PowerPlatformEnvironment, ...] = ()
         self._current_environment: Optional[PowerPlatformEnvironment] = None
+        
+        # Summary counters, maintained as environments are loaded
+        self._type_counter: Counter = Counter()
+        self._region_counter: Counter = Counter()
+        self._state_counter: Counter = Counter()
+        
+        # Search structures, rebuilt whenever environments are loaded
+        self._search_blob = ""
+        self._search_offsets: List[int] = []
+        self._trigram_index: Dict[str, Set[int]] = {}
     
     def refresh_environments(self) -> bool:
         """Refresh the list of available environments."""
         try:
-            env_data = self.pac_cli.get_environments()
-            self._environments = []
-            
-            for env in env_data:
-                environment = PowerPlatformEnvironment(
-                    name=env.get('EnvironmentName', ''),
-                    display_name=env.get('FriendlyName', ''),
-                    url=env.get('EnvironmentUrl', ''),
-                    region=env.get('Region', ''),
-                    environment_type=env.get('EnvironmentType', ''),
-                    state=env.get('State', ''),
-                    created_time=self._parse_datetime(env.get('CreatedTime'))
-                )
-                self._environments.append(environment)
-            
-            self.logger.info(f"Refreshed {len(self._environments)} environments")
+            self._load_environments(self.pac_cli.get_environments())
             return True
             
         except Exception as e:
             self.logger.error(f"Failed to refresh environments: {str(e)}")
             return False
     
-    def _parse_datetime(self, date_string: str) -> Optional[datetime]:
-        """Parse datetime string from Power Platform API."""
-        if not date_string:
-            return None
+    async def refresh_environments_async(self, include_current: bool = False) -> bool:
+        """
+        Refresh the list of available environments without blocking.
         
+        Args:
+            include_current: Also refresh the currently selected environment,
+                querying PAC CLI for both concurrently
+                
+        Returns:
+            True if successful, False otherwise
+        """
         try:
-            # Try common datetime formats
-            formats = [
-                "%Y-%m-%dT%H:%M:%S.%fZ",
-                "%Y-%m-%dT%H:%M:%SZ",
-                "%Y-%m-%d %H:%M:%S"
-            ]
+            if include_current:
+                environments, current_info = await asyncio.gather(
+                    self.pac_cli.get_environments_async(),
+                    self.pac_cli.get_current_environment_async()
+                )
+            else:
+                environments = await self.pac_cli.get_environments_async()
+                current_info = None
+            
+            self._load_environments(environments)
             
-            for fmt in formats:
-                try:
-                    return datetime.strptime(date_string, fmt)
-                except ValueError:
-                    continue
+            if current_info:
+                self._current_environment = self._match_environment(current_info)
             
-            self.logger.warning(f"Could not parse datetime: {date_string}")
-            return None
+            return True
             
         except Exception as e:
-            self.logger.error(f"Error parsing datetime {date_string}: {str(e)}")
-            return None
+            self.logger.error(f"Failed to refresh environments: {str(e)}")
+            return False
+    
+    def _load_environments(self, environments: List[PowerPlatformEnvironment]) -> None:
+        """Store freshly fetched environments and rebuild derived data."""
+        self._environments = list(environments)
+        self._env_tuple = tuple(self._environments)
+        type_counter = self._type_counter
+        region_counter = self._region_counter
+        state_counter = self._state_counter
+        type_counter.clear()
+        region_counter.clear()
+        state_counter.clear()
+        
+        for env_type, region, state in map(_summary_getter, self._environments):
+            type_counter[env_type or "Unknown"] += 1
+            region_counter[region or "Unknown"] += 1
+            state_counter[state or "Unknown"] += 1
+        
+        self._build_search_index()
+        
+        self.logger.info(f"Refreshed {len(self._environments)} environments")
     
-    def get_environments(self) -> List[PowerPlatformEnvironment]:
-        """Get the list of available environments."""
-        return self._environments.copy()
+    def _match_environment(self, info: Dict[str, Any]) -> Optional[PowerPlatformEnvironment]:
+        """Find the environment matching an `org who` response."""
+        url = (info.get('OrgUrl') or info.get('EnvironmentUrl') or '').rstrip('/').lower()
+        if not url:
+            return self._current_environment
+        
+        for env in self._environments:
+            if env.url.rstrip('/').lower() == url:
+                return env
+        
+        return self._current_environment
+    
+    def get_environments(self) -> Tuple[PowerPlatformEnvironment, ...]:
+        """
+        Get the available environments.
+        
+        Returns an immutable tuple that is shared between callers and only
+        replaced when the environments are refreshed.
+        """
+        return self._env_tuple
+    
+    def get_environments_mutable(self) -> List[PowerPlatformEnvironment]:
+        """Get a mutable copy of the list of available environments."""
+        return list(self._environments)
     
     def select_environment(self, environment: PowerPlatformEnvironment) -> bool:
         """Select an environment as the current working environment."""
@@ -113,32 +259,69 @@ class EnvironmentManager:
     
     def get_environment_summary(self) -> Dict[str, Any]:
         """Get a summary of all environments by type and region."""
-        summary = {
+        return {
             "total": len(self._environments),
-            "by_type": {},
-            "by_region": {},
-            "by_state": {}
+            "by_type": dict(self._type_counter),
+            "by_region": dict(self._region_counter),
+            "by_state": dict(self._state_counter)
         }
+    
+    def _build_search_index(self) -> None:
+        """Build the search blob and, for very large lists, the trigram index."""
+        lines = [f"{env.name_lc}\t{env.display_lc}" for env in self._environments]
         
-        for env in self._environments:
-            # Count by type
-            env_type = env.environment_type or "Unknown"
-            summary["by_type"][env_type] = summary["by_type"].get(env_type, 0) + 1
-            
-            # Count by region
-            region = env.region or "Unknown"
-            summary["by_region"][region] = summary["by_region"].get(region, 0) + 1
-            
-            # Count by state
-            state = env.state or "Unknown"
-            summary["by_state"][state] = summary["by_state"].get(state, 0) + 1
+        self._search_offsets = []
+        offset = 0
+        for line in lines:
+            self._search_offsets.append(offset)
+            offset += len(line) + 1
+        self._search_blob = "\n".join(lines)
         
-        return summary
+        self._trigram_index = {}
+        if len(self._environments) > _TRIGRAM_THRESHOLD:
+            index = defaultdict(set)
+            for i, env in enumerate(self._environments):
+                for text in (env.name_lc, env.display_lc):
+                    for j in range(len(text) - 2):
+                        index[text[j:j + 3]].add(i)
+            self._trigram_index = dict(index)
     
     def search_environments(self, query: str) -> List[PowerPlatformEnvironment]:
         """Search environments by name or display name."""
         query_lower = query.lower()
-        return [
-            env for env in self._environments
-            if query_lower in env.name.lower() or query_lower in env.display_name.lower()
-        ]
+        
+        if not query_lower:
+            return list(self._environments)
+        
+        if "\t" in query_lower or "\n" in query_lower:
+            return [
+                env for env in self._environments
+                if query_lower in env.name_lc or query_lower in env.display_lc
+            ]
+        
+        if self._trigram_index and len(query_lower) >= 3:
+            candidates = None
+            for j in range(len(query_lower) - 2):
+                matches = self._trigram_index.get(query_lower[j:j + 3], set())
+                candidates = matches if candidates is None else candidates & matches
+                if not candidates:
+                    return []
+            return [
+                self._environments[i] for i in sorted(candidates)
+                if query_lower in self._environments[i].name_lc
+                or query_lower in self._environments[i].display_lc
+            ]
+        
+        # Scan the whole blob with str.find, skipping to the next line after each hit
+        results = []
+        blob = self._search_blob
+        offsets = self._search_offsets
+        pos = blob.find(query_lower)
+        while pos >= 0:
+            i = bisect_right(offsets, pos) - 1
+            results.append(self._environments[i])
+            if i + 1 >= len(offsets):
+                break
+            pos = blob.find(query_lower, offsets[i + 1])
+        
+        return results
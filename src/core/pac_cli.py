@@ -6,18 +6,173 @@ to enable easy integration with the GUI application.
 """
 
 import subprocess
-import json
 import logging
 import asyncio
-from typing import Dict, List, Optional, Any
+import contextlib
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
+from core._pac_version_cache import get_pac_version, pac_check_skipped
+from core.environment import PowerPlatformEnvironment, _parse_datetime_cached
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+# Size of each read from a PAC CLI process's stdout pipe
+_READ_CHUNK_SIZE = 65536
+
+# Seconds a completed query result is reused by later identical queries
+_SINGLE_FLIGHT_TTL = 0.5
+
+# Default maximum number of PAC CLI processes running at once
+_DEFAULT_MAX_PARALLEL = 4
+
+
+def _max_parallel_commands() -> int:
+    """Read the PAC_MAX_PARALLEL limit, falling back to the default if invalid."""
+    value = os.environ.get("PAC_MAX_PARALLEL")
+    if not value:
+        return _DEFAULT_MAX_PARALLEL
+    
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logging.getLogger(__name__).warning(
+            f"Ignoring invalid PAC_MAX_PARALLEL value {value!r}; using {_DEFAULT_MAX_PARALLEL}"
+        )
+        return _DEFAULT_MAX_PARALLEL
+
+
+# Maximum number of PAC CLI processes running at once across all threads
+_MAX_PARALLEL_COMMANDS = _max_parallel_commands()
+
+# Threads that wait on process-wide locks so event loops are never blocked
+_LOCK_WAITERS = ThreadPoolExecutor(thread_name_prefix="pac-lock-wait")
+
+
+if msgspec is not None:
+    class _RawEnvironment(msgspec.Struct):
+        """Typed shape of a PAC CLI `org list` record."""
+        
+        EnvironmentName: str = ""
+        FriendlyName: str = ""
+        EnvironmentUrl: str = ""
+        Region: str = ""
+        EnvironmentType: str = ""
+        State: str = ""
+        CreatedTime: Optional[str] = None
+    
+    _decode_environments = msgspec.json.Decoder(List[_RawEnvironment]).decode
+
 
 class PACCLIError(Exception):
     """Custom exception for PAC CLI related errors."""
     pass
 
 
+class _QueryAbandoned(Exception):
+    """The caller running a shared query was cancelled before it finished."""
+    pass
+
+
+def _detached(value: Any) -> Any:
+    """Copy the lists and dicts of a shared query result for one caller."""
+    if isinstance(value, list):
+        return [_detached(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _detached(item) for key, item in value.items()}
+    return value
+
+
+class _StateLock:
+    """
+    Process-wide readers-writer lock around the PAC CLI's selected state.
+    
+    Queries hold it shared, so they can run together; commands that change
+    the selected environment, credentials or solutions hold it exclusively,
+    so no query runs while the state is changing. Waiting writers block new
+    readers so a stream of queries cannot starve them.
+    """
+    
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+    
+    def acquire_read(self, blocking: bool = True) -> bool:
+        with self._condition:
+            while self._writer or self._writers_waiting:
+                if not blocking:
+                    return False
+                self._condition.wait()
+            self._readers += 1
+            return True
+    
+    def release_read(self) -> None:
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+    
+    def acquire_write(self, blocking: bool = True) -> bool:
+        with self._condition:
+            if self._writer or self._readers:
+                if not blocking:
+                    return False
+                
+                self._writers_waiting += 1
+                try:
+                    while self._writer or self._readers:
+                        self._condition.wait()
+                finally:
+                    self._writers_waiting -= 1
+            
+            self._writer = True
+            return True
+    
+    def release_write(self) -> None:
+        with self._condition:
+            self._writer = False
+            self._condition.notify_all()
+
+
+@contextlib.asynccontextmanager
+async def _hold(acquire: Callable[[bool], bool], release: Callable[[], None]) -> AsyncIterator[None]:
+    """
+    Hold a thread-level lock from a coroutine without blocking its loop.
+    
+    The uncontended case acquires directly; otherwise the blocking acquire
+    runs on a waiter thread. If the waiting task is cancelled after that
+    acquire has started, the lock is released as soon as it is obtained.
+    """
+    if not acquire(False):
+        future = _LOCK_WAITERS.submit(acquire, True)
+        try:
+            await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if not future.cancel():
+                future.add_done_callback(lambda _: release())
+            raise
+    
+    try:
+        yield
+    finally:
+        release()
+
+
 class PACCLIWrapper:
     """
     A Python wrapper for the Power Platform CLI (PAC CLI).
@@ -26,21 +181,25 @@ class PACCLIWrapper:
     solutions, and other resources through the PAC CLI.
     """
     
-    def __init__(self):
+    def __init__(self, force_refresh: bool = False):
         self.logger = logging.getLogger(__name__)
-        self._check_pac_installation()
+        self._inflight: Dict[Tuple[Any, ...], Tuple[Future, float]] = {}
+        self._inflight_lock = threading.Lock()
+        # Shared by every thread and event loop using this wrapper
+        self._process_slots = threading.BoundedSemaphore(_MAX_PARALLEL_COMMANDS)
+        self._state_lock = _StateLock()
+        self._check_pac_installation(force_refresh)
     
-    def _check_pac_installation(self) -> bool:
+    def _check_pac_installation(self, force_refresh: bool = False) -> bool:
         """Check if PAC CLI is installed and accessible."""
+        if pac_check_skipped():
+            self.logger.info("Skipping PAC CLI installation check")
+            return True
+        
         try:
-            result = subprocess.run(
-                ["pac", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                self.logger.info(f"PAC CLI found: {result.stdout.strip()}")
+            version = get_pac_version(force_refresh=force_refresh)
+            if version is not None:
+                self.logger.info(f"PAC CLI found: {version}")
                 return True
             else:
                 raise PACCLIError("PAC CLI not found or not accessible")
@@ -49,65 +208,265 @@ class PACCLIWrapper:
         except FileNotFoundError:
             raise PACCLIError("PAC CLI not installed. Please install Power Platform CLI first.")
     
-    def run_command(self, command: List[str], timeout: int = 30) -> Dict[str, Any]:
+    def _reading_state(self):
+        """Hold the state lock shared, for a query."""
+        return _hold(self._state_lock.acquire_read, self._state_lock.release_read)
+    
+    def _changing_state(self):
+        """Hold the state lock exclusively, for a command that changes state."""
+        return _hold(self._state_lock.acquire_write, self._state_lock.release_write)
+    
+    async def run_command_async(
+        self,
+        command: List[str],
+        timeout: int = 30,
+        on_progress: Optional[Callable[[int], None]] = None
+    ) -> Dict[str, Any]:
         """
-        Execute a PAC CLI command and return the result.
+        Execute a PAC CLI command asynchronously and return the result.
         
         Args:
             command: List of command arguments
             timeout: Command timeout in seconds
+            on_progress: Optional callback receiving the number of stdout
+                bytes read so far, called as output streams in
             
         Returns:
-            Dictionary containing command result and metadata
+            Dictionary containing command result and metadata. command is
+            the command line as a string, as callers have always read it.
+            stdout and stderr_bytes are the raw output, so stdout can be
+            handed straight to the JSON parser; stderr is always decoded,
+            including warnings PAC CLI writes on success
         """
         full_command = ["pac"] + command
-        self.logger.debug(f"Executing command: {' '.join(full_command)}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Executing command: %s", ' '.join(full_command))
+        
+        # Every worker thread runs its own event loop, so the cap is enforced
+        # with a process-wide semaphore rather than an asyncio one
+        async with _hold(self._process_slots.acquire, self._process_slots.release):
+            return await self._execute(full_command, timeout, on_progress)
+    
+    async def _execute(
+        self,
+        full_command: List[str],
+        timeout: int,
+        on_progress: Optional[Callable[[int], None]]
+    ) -> Dict[str, Any]:
+        """Spawn a PAC CLI process and collect its output."""
+        proc = await asyncio.create_subprocess_exec(
+            *full_command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        
+        async def read_stdout() -> bytes:
+            buf = bytearray()
+            while True:
+                chunk = await proc.stdout.read(_READ_CHUNK_SIZE)
+                if not chunk:
+                    return bytes(buf)
+                buf.extend(chunk)
+                if on_progress is not None:
+                    on_progress(len(buf))
+        
+        async def collect() -> Tuple[bytes, bytes]:
+            # Drain stderr concurrently so a chatty child cannot block on a full pipe
+            stdout, stderr = await asyncio.gather(read_stdout(), proc.stderr.read())
+            await proc.wait()
+            return stdout, stderr
         
         try:
-            result = subprocess.run(
-                full_command,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
-            
-            return {
-                "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "returncode": result.returncode,
-                "command": ' '.join(full_command)
-            }
-            
-        except subprocess.TimeoutExpired:
-            self.logger.error(f"Command timed out: {' '.join(full_command)}")
+            stdout, stderr = await asyncio.wait_for(collect(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            command_line = ' '.join(full_command)
+            self.logger.error(f"Command timed out: {command_line}")
             return {
                 "success": False,
-                "stdout": "",
+                "stdout": b"",
                 "stderr": "Command timed out",
+                "stderr_bytes": b"Command timed out",
                 "returncode": -1,
-                "command": ' '.join(full_command)
+                "command": command_line
             }
+        
+        success = proc.returncode == 0
+        return {
+            "success": success,
+            "stdout": stdout,
+            "stderr": stderr.decode("utf-8", "replace"),
+            "stderr_bytes": stderr,
+            "returncode": proc.returncode,
+            "command": ' '.join(full_command)
+        }
     
-    def get_environments(self) -> List[Dict[str, Any]]:
-        """Get list of Power Platform environments."""
-        result = self.run_command(["org", "list", "--json"])
+    def run_command(
+        self,
+        command: List[str],
+        timeout: int = 30,
+        on_progress: Optional[Callable[[int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute a PAC CLI command and return the result.
         
-        if result["success"]:
+        Blocking wrapper around run_command_async for synchronous callers.
+        
+        Args:
+            command: List of command arguments
+            timeout: Command timeout in seconds
+            on_progress: Optional callback receiving the number of stdout
+                bytes read so far
+            
+        Returns:
+            Dictionary containing command result and metadata
+        """
+        return asyncio.run(self.run_command_async(command, timeout, on_progress))
+    
+    def _parse_json_output(self, result: Dict[str, Any], description: str) -> Optional[Any]:
+        """Parse the JSON stdout of a command result, logging failures."""
+        if not result["success"]:
+            self.logger.error(f"Failed to get {description}: {result['stderr']}")
+            return None
+        
+        try:
+            return json_loads(result["stdout"])
+        except ValueError:
+            self.logger.error(f"Failed to parse {description} JSON response")
+            return None
+    
+    async def _single_flight(
+        self,
+        key: Tuple[Any, ...],
+        factory: Callable[[], Awaitable[Tuple[Any, bool]]]
+    ) -> Any:
+        """
+        Run a query once for concurrent callers and reuse its result briefly.
+        
+        Callers arriving while the query for `key` is running await the same
+        result, even from another thread's event loop. The factory returns
+        the result together with whether the query succeeded; only a
+        successful result is reused, for _SINGLE_FLIGHT_TTL seconds. Every
+        caller gets its own copy of the result's lists and dicts.
+        
+        If the caller running the query is cancelled, the query is dropped
+        and the callers waiting on it start it again themselves.
+        """
+        while True:
+            with self._inflight_lock:
+                entry = self._inflight.get(key)
+                if entry is not None and (not entry[0].done() or time.monotonic() < entry[1]):
+                    future = entry[0]
+                    owner = False
+                else:
+                    future = Future()
+                    # A running future cannot be cancelled, so a waiter that
+                    # is cancelled or times out leaves the shared result intact
+                    future.set_running_or_notify_cancel()
+                    self._inflight[key] = (future, float("inf"))
+                    owner = True
+            
+            if owner:
+                break
+            
             try:
-                # Parse JSON output
-                environments = json.loads(result["stdout"])
-                return environments
-            except json.JSONDecodeError:
+                return _detached(await asyncio.wrap_future(future))
+            except _QueryAbandoned:
+                continue
+        
+        try:
+            result, succeeded = await factory()
+        except BaseException as e:
+            with self._inflight_lock:
+                if self._inflight.get(key, (None,))[0] is future:
+                    del self._inflight[key]
+            # Cancellation belongs to this caller only; the others retry
+            future.set_exception(_QueryAbandoned() if isinstance(e, asyncio.CancelledError) else e)
+            raise
+        
+        with self._inflight_lock:
+            if self._inflight.get(key, (None,))[0] is future:
+                if succeeded:
+                    self._inflight[key] = (future, time.monotonic() + _SINGLE_FLIGHT_TTL)
+                else:
+                    del self._inflight[key]
+        future.set_result(result)
+        return _detached(result)
+    
+    def _invalidate_cached_queries(self) -> None:
+        """Drop reusable query results after a command changes PAC CLI state."""
+        with self._inflight_lock:
+            self._inflight.clear()
+    
+    def _parse_environments(self, stdout: bytes) -> Optional[List[PowerPlatformEnvironment]]:
+        """
+        Parse `org list` JSON output straight into environment records.
+        
+        Returns None if the output is not valid JSON or not a list of
+        environment objects.
+        """
+        if msgspec is not None:
+            try:
+                raw_environments = _decode_environments(stdout)
+            except msgspec.ValidationError:
+                # Unexpected field types; use the lenient dict-based path below
+                raw_environments = None
+            except msgspec.DecodeError:
                 self.logger.error("Failed to parse environments JSON response")
-                return []
-        else:
+                return None
+            
+            if raw_environments is not None:
+                return [
+                    PowerPlatformEnvironment(
+                        name=raw.EnvironmentName,
+                        display_name=raw.FriendlyName,
+                        url=raw.EnvironmentUrl,
+                        region=raw.Region,
+                        environment_type=raw.EnvironmentType,
+                        state=raw.State,
+                        created_time=_parse_datetime_cached(raw.CreatedTime) if raw.CreatedTime else None
+                    )
+                    for raw in raw_environments
+                ]
+        
+        try:
+            records = json_loads(stdout)
+        except ValueError:
+            self.logger.error("Failed to parse environments JSON response")
+            return None
+        
+        if not isinstance(records, list) or not all(isinstance(record, dict) for record in records):
+            self.logger.error("Unexpected environments JSON response: expected a list of objects")
+            return None
+        return [PowerPlatformEnvironment.from_pac(record) for record in records]
+    
+    async def _get_environments_uncached(self) -> Tuple[List[PowerPlatformEnvironment], bool]:
+        async with self._reading_state():
+            result = await self.run_command_async(["org", "list", "--json"])
+        
+        if not result["success"]:
             self.logger.error(f"Failed to get environments: {result['stderr']}")
-            return []
+            return [], False
+        
+        environments = self._parse_environments(result["stdout"])
+        if environments is None:
+            return [], False
+        return environments, True
     
-    def select_environment(self, environment_url: str) -> bool:
+    async def get_environments_async(self) -> List[PowerPlatformEnvironment]:
+        """Get list of Power Platform environments."""
+        return await self._single_flight(("get_environments",), self._get_environments_uncached)
+    
+    def get_environments(self) -> List[PowerPlatformEnvironment]:
+        """Get list of Power Platform environments."""
+        return asyncio.run(self.get_environments_async())
+    
+    async def select_environment_async(self, environment_url: str) -> bool:
         """Select a Power Platform environment."""
-        result = self.run_command(["org", "select", "--environment", environment_url])
+        async with self._changing_state():
+            result = await self.run_command_async(["org", "select", "--environment", environment_url])
+            self._invalidate_cached_queries()
         
         if result["success"]:
             self.logger.info(f"Successfully selected environment: {environment_url}")
@@ -116,22 +475,32 @@ class PACCLIWrapper:
             self.logger.error(f"Failed to select environment: {result['stderr']}")
             return False
     
+    def select_environment(self, environment_url: str) -> bool:
+        """Select a Power Platform environment."""
+        return asyncio.run(self.select_environment_async(environment_url))
+    
+    async def _get_solutions_uncached(self) -> Tuple[List[Dict[str, Any]], bool]:
+        async with self._reading_state():
+            result = await self.run_command_async(["solution", "list", "--json"])
+        
+        solutions = self._parse_json_output(result, "solutions")
+        return solutions or [], solutions is not None
+    
+    async def get_solutions_async(self) -> List[Dict[str, Any]]:
+        """Get list of solutions in the current environment."""
+        return await self._single_flight(("get_solutions",), self._get_solutions_uncached)
+    
     def get_solutions(self) -> List[Dict[str, Any]]:
         """Get list of solutions in the current environment."""
-        result = self.run_command(["solution", "list", "--json"])
-        
-        if result["success"]:
-            try:
-                solutions = json.loads(result["stdout"])
-                return solutions
-            except json.JSONDecodeError:
-                self.logger.error("Failed to parse solutions JSON response")
-                return []
-        else:
-            self.logger.error(f"Failed to get solutions: {result['stderr']}")
-            return []
+        return asyncio.run(self.get_solutions_async())
     
-    def export_solution(self, solution_name: str, output_path: str, managed: bool = False) -> bool:
+    async def export_solution_async(
+        self,
+        solution_name: str,
+        output_path: str,
+        managed: bool = False,
+        on_progress: Optional[Callable[[int], None]] = None
+    ) -> bool:
         """Export a solution from the current environment."""
         command = [
             "solution", "export",
@@ -142,7 +511,9 @@ class PACCLIWrapper:
         if managed:
             command.append("--managed")
         
-        result = self.run_command(command, timeout=300)  # 5 minutes timeout for export
+        # 5 minutes timeout for export
+        async with self._reading_state():
+            result = await self.run_command_async(command, timeout=300, on_progress=on_progress)
         
         if result["success"]:
             self.logger.info(f"Successfully exported solution: {solution_name}")
@@ -151,7 +522,24 @@ class PACCLIWrapper:
             self.logger.error(f"Failed to export solution: {result['stderr']}")
             return False
     
-    def import_solution(self, solution_path: str, publish_workflows: bool = True) -> bool:
+    def export_solution(
+        self,
+        solution_name: str,
+        output_path: str,
+        managed: bool = False,
+        on_progress: Optional[Callable[[int], None]] = None
+    ) -> bool:
+        """Export a solution from the current environment."""
+        return asyncio.run(
+            self.export_solution_async(solution_name, output_path, managed, on_progress)
+        )
+    
+    async def import_solution_async(
+        self,
+        solution_path: str,
+        publish_workflows: bool = True,
+        on_progress: Optional[Callable[[int], None]] = None
+    ) -> bool:
         """Import a solution to the current environment."""
         command = [
             "solution", "import",
@@ -161,7 +549,10 @@ class PACCLIWrapper:
         if publish_workflows:
             command.append("--publish-changes")
         
-        result = self.run_command(command, timeout=600)  # 10 minutes timeout for import
+        # 10 minutes timeout for import
+        async with self._changing_state():
+            result = await self.run_command_async(command, timeout=600, on_progress=on_progress)
+            self._invalidate_cached_queries()
         
         if result["success"]:
             self.logger.info(f"Successfully imported solution: {solution_path}")
@@ -170,24 +561,39 @@ class PACCLIWrapper:
             self.logger.error(f"Failed to import solution: {result['stderr']}")
             return False
     
+    def import_solution(
+        self,
+        solution_path: str,
+        publish_workflows: bool = True,
+        on_progress: Optional[Callable[[int], None]] = None
+    ) -> bool:
+        """Import a solution to the current environment."""
+        return asyncio.run(
+            self.import_solution_async(solution_path, publish_workflows, on_progress)
+        )
+    
+    async def _get_current_environment_uncached(self) -> Tuple[Optional[Dict[str, Any]], bool]:
+        async with self._reading_state():
+            result = await self.run_command_async(["org", "who", "--json"])
+        
+        current = self._parse_json_output(result, "current environment")
+        return current, current is not None
+    
+    async def get_current_environment_async(self) -> Optional[Dict[str, Any]]:
+        """Get information about the currently selected environment."""
+        return await self._single_flight(
+            ("get_current_environment",), self._get_current_environment_uncached
+        )
+    
     def get_current_environment(self) -> Optional[Dict[str, Any]]:
         """Get information about the currently selected environment."""
-        result = self.run_command(["org", "who", "--json"])
-        
-        if result["success"]:
-            try:
-                environment_info = json.loads(result["stdout"])
-                return environment_info
-            except json.JSONDecodeError:
-                self.logger.error("Failed to parse current environment JSON response")
-                return None
-        else:
-            self.logger.error(f"Failed to get current environment: {result['stderr']}")
-            return None
+        return asyncio.run(self.get_current_environment_async())
     
-    def authenticate(self) -> bool:
+    async def authenticate_async(self) -> bool:
         """Authenticate with Power Platform."""
-        result = self.run_command(["auth", "create"])
+        async with self._changing_state():
+            result = await self.run_command_async(["auth", "create"])
+            self._invalidate_cached_queries()
         
         if result["success"]:
             self.logger.info("Successfully authenticated with Power Platform")
@@ -195,3 +601,7 @@ class PACCLIWrapper:
         else:
             self.logger.error(f"Failed to authenticate: {result['stderr']}")
             return False
+    
+    def authenticate(self) -> bool:
+        """Authenticate with Power Platform."""
+        return asyncio.run(self.authenticate_async())
@@ -17,11 +17,6 @@ from pathlib import Path
 # Add the src directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QIcon
-
-from ui.main_window import MainWindow
 from utils.helpers import setup_logging, load_config
 
 
@@ -34,6 +29,15 @@ def main():
     
     logger.info("Starting Power Platform Utility...")
     
+    # Load configuration
+    config = load_config()
+    
+    # Import Qt lazily so importing this module stays cheap
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import Qt
+    
+    from ui.main_window import MainWindow
+    
     # Create QApplication
     app = QApplication(sys.argv)
     app.setApplicationName("Power Platform Utility")
@@ -44,9 +48,6 @@ def main():
     app.setAttribute(Qt.AA_UseHighDpiPixmaps)
     app.setAttribute(Qt.AA_EnableHighDpiScaling)
     
-    # Load configuration
-    config = load_config()
-    
     # Create and show main window
     main_window = MainWindow(config)
     main_window.show()
@@ -4,44 +4,167 @@ Main Application Window
 This module contains the main window class for the Power Platform Utility application.
 """
 
+import asyncio
+import functools
 import logging
+import os
 import sys
-from typing import Dict, Any, Optional, List
+from collections import deque
+from typing import Deque, Dict, Any, Optional, List, Sequence, Set, Tuple
 from pathlib import Path
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
     QMenuBar, QStatusBar, QToolBar, QLabel, QComboBox, QPushButton,
-    QTableWidget, QTableWidgetItem, QTextEdit, QSplitter, QGroupBox,
+    QTableView, QPlainTextEdit, QSplitter, QGroupBox,
     QProgressBar, QMessageBox, QFileDialog, QDialog, QDialogButtonBox,
     QFormLayout, QLineEdit, QCheckBox, QFrame
 )
-from PySide6.QtCore import Qt, QTimer, QThread, Signal, QSize
-from PySide6.QtGui import QAction, QIcon, QFont, QPixmap
+from PySide6.QtCore import (
+    Qt, QTimer, QThreadPool, QRunnable, QObject, Signal, Slot, QSize,
+    QAbstractTableModel, QModelIndex, QSettings
+)
+from PySide6.QtGui import QAction, QIcon, QFont, QPixmap, QStandardItem, QStandardItemModel
 
 from core.pac_cli import PACCLIWrapper, PACCLIError
 from core.environment import EnvironmentManager, PowerPlatformEnvironment
+from utils.helpers import UIConfig, format_file_size
+
+
+# Thread pool priorities; user-initiated operations run ahead of background refreshes
+BACKGROUND_PRIORITY = 0
+USER_PRIORITY = 1
+
+# Log views are refreshed at most this often, and keep this many lines
+LOG_FLUSH_INTERVAL_MS = 100
+LOG_MAX_LINES = 5000
+
+# Rapid refresh requests within this window are coalesced into one
+REFRESH_DEBOUNCE_MS = 150
+
+# Time allowed for running tasks to finish when the window closes
+SHUTDOWN_WAIT_MS = 500
+
+# Action icons, looked up by name as <name>.svg
+_ICON_DIR = Path(__file__).resolve().parent / "icons"
+
+# Indexes of the lazily built tabs
+SOLUTIONS_TAB = 1
+IMPORT_EXPORT_TAB = 2
+LOGS_TAB = 3
+
+
+@functools.lru_cache(maxsize=64)
+def _icon(name: str) -> QIcon:
+    """
+    Load an action icon once and share it between every action using it.
+    
+    Returns an empty icon if the icon file does not exist.
+    """
+    path = _ICON_DIR / f"{name}.svg"
+    if not path.is_file():
+        return QIcon()
+    return QIcon(str(path))
+
+
+def _form_group(title: str, rows: Sequence[Tuple[Optional[str], Any]]) -> QGroupBox:
+    """
+    Build a group box holding a QFormLayout.
+    
+    Args:
+        title: Group box title
+        rows: (label, field) pairs, where a field is a widget or layout;
+            rows without a label span the full width
+    """
+    group = QGroupBox(title)
+    add_row = QFormLayout(group).addRow
+    for label, field in rows:
+        if label is None:
+            add_row(field)
+        else:
+            add_row(label, field)
+    return group
+
+
+def _browse_row(line_edit: QLineEdit, on_browse) -> QHBoxLayout:
+    """Lay out a path line edit followed by a "Browse..." button."""
+    browse_btn = QPushButton("Browse...")
+    browse_btn.clicked.connect(on_browse)
+    
+    row = QHBoxLayout()
+    row.addWidget(line_edit)
+    row.addWidget(browse_btn)
+    return row
 
 
-class WorkerThread(QThread):
-    """Background worker thread for long-running operations."""
+class WorkerSignals(QObject):
+    """Signals emitted by a WorkerTask, which cannot emit signals itself."""
     
-    finished = Signal(dict)
+    finished = Signal(object)
     error = Signal(str)
     progress = Signal(str)
+    done = Signal()
+
+
+class WorkerTask(QRunnable):
+    """Background task for long-running operations, run on a thread pool."""
     
     def __init__(self, operation, *args, **kwargs):
         super().__init__()
         self.operation = operation
         self.args = args
         self.kwargs = kwargs
+        self.signals = WorkerSignals()
     
     def run(self):
         try:
             result = self.operation(*self.args, **self.kwargs)
-            self.finished.emit(result)
+            self.signals.finished.emit(result)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
+        finally:
+            self.signals.done.emit()
+
+
+class SolutionsModel(QAbstractTableModel):
+    """Table model presenting solution records returned by PAC CLI."""
+    
+    COLUMNS = ('UniqueName', 'FriendlyName', 'Version', 'IsManaged')
+    HEADERS = ("Name", "Display Name", "Version", "Managed")
+    
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._rows: List[Dict[str, Any]] = []
+    
+    def set_solutions(self, solutions: List[Dict[str, Any]]):
+        """Replace the displayed solutions."""
+        self.beginResetModel()
+        self._rows = solutions
+        self.endResetModel()
+    
+    def solutions(self) -> List[Dict[str, Any]]:
+        """Get the displayed solutions."""
+        return self._rows
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        
+        column = self.COLUMNS[index.column()]
+        if column == 'IsManaged':
+            return str(self._rows[index.row()].get(column, False))
+        return str(self._rows[index.row()].get(column, ''))
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
 
 
 class MainWindow(QMainWindow):
@@ -51,6 +174,7 @@ class MainWindow(QMainWindow):
         super().__init__()
         
         self.config = config
+        self.ui_config = UIConfig.from_config(config)
         self.logger = logging.getLogger(__name__)
         
         # Initialize core components
@@ -68,16 +192,60 @@ class MainWindow(QMainWindow):
         self.status_label = None
         self.progress_bar = None
         self.log_text = None
+        self.log_splitter = None
+        self.export_solution_combo = None
+        self.detailed_log_text = None
+        
+        # Solutions are held in a model so they can be loaded before the
+        # Solutions tab has been built
+        self.solutions_model = SolutionsModel(self)
         
         # Current state
         self.current_environment = None
         
+        # Names of operations that are running and must not be started again
+        self._inflight: Set[str] = set()
+        
+        # Widgets and actions that start a refresh, disabled while one runs
+        self._refresh_controls: List[Any] = []
+        
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(REFRESH_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self.start_refresh)
+        
+        # Submitted tasks, kept alive until they report completion
+        self._active_tasks: Dict[WorkerSignals, WorkerTask] = {}
+        
+        # I/O-bound operations (PAC CLI calls) mostly wait on subprocesses,
+        # so they get a wider pool; CPU-bound local work such as reading
+        # exported solution files is kept to one thread per core.
+        self.io_pool = QThreadPool()
+        self.io_pool.setMaxThreadCount(8)
+        self.cpu_pool = QThreadPool()
+        self.cpu_pool.setMaxThreadCount(os.cpu_count() or 1)
+        
+        # Status messages set within one event loop pass collapse into a
+        # single label update
+        self._pending_status: Optional[str] = None
+        
+        # Log lines are queued and written to the log views in batches
+        self._log_queue: Deque[str] = deque()
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self.flush_log)
+        
         self.setup_ui()
         self.setup_menu_bar()
         self.setup_tool_bar()
         self.setup_status_bar()
         self.setup_connections()
         
+        # Window layout is stored by Qt under the application's organization
+        self._settings = QSettings("Power Platform Tools", "Power Platform Utility")
+        self.restore_window_state()
+        
         # Load initial data
         self.refresh_environments()
         
@@ -91,9 +259,7 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(1000, 700)
         
         # Apply window size from config
-        width = self.config.get("ui", {}).get("window_width", 1200)
-        height = self.config.get("ui", {}).get("window_height", 800)
-        self.resize(width, height)
+        self.resize(self.ui_config.window_width, self.ui_config.window_height)
         
         # Create central widget
         self.central_widget = QWidget()
@@ -110,11 +276,16 @@ class MainWindow(QMainWindow):
         env_layout.addWidget(QLabel("Environment:"))
         self.environment_combo = QComboBox()
         self.environment_combo.setMinimumWidth(300)
+        
+        # Environments are loaded into the model in one batch on each refresh
+        self._env_model = QStandardItemModel(self)
+        self.environment_combo.setModel(self._env_model)
         env_layout.addWidget(self.environment_combo)
         
         refresh_btn = QPushButton("Refresh")
         refresh_btn.clicked.connect(self.refresh_environments)
         env_layout.addWidget(refresh_btn)
+        self._refresh_controls.append(refresh_btn)
         
         connect_btn = QPushButton("Connect")
         connect_btn.clicked.connect(self.connect_to_environment)
@@ -128,29 +299,37 @@ class MainWindow(QMainWindow):
         self.tab_widget = QTabWidget()
         main_layout.addWidget(self.tab_widget)
         
-        # Create tabs
+        # Create tabs; only the overview is built up front, the others are
+        # built from their factories the first time they are selected
         self.create_overview_tab()
-        self.create_solutions_tab()
-        self.create_import_export_tab()
-        self.create_logs_tab()
+        
+        self._tab_factories = {
+            SOLUTIONS_TAB: self.create_solutions_tab,
+            IMPORT_EXPORT_TAB: self.create_import_export_tab,
+            LOGS_TAB: self.create_logs_tab,
+        }
+        self.tab_widget.addTab(QWidget(), "Solutions")
+        self.tab_widget.addTab(QWidget(), "Import/Export")
+        self.tab_widget.addTab(QWidget(), "Logs")
         
         # Log section at bottom
-        log_splitter = QSplitter(Qt.Vertical)
-        log_splitter.addWidget(self.tab_widget)
+        self.log_splitter = QSplitter(Qt.Vertical)
+        self.log_splitter.addWidget(self.tab_widget)
         
         log_group = QGroupBox("Activity Log")
         log_layout = QVBoxLayout(log_group)
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setMaximumHeight(150)
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(LOG_MAX_LINES)
         log_layout.addWidget(self.log_text)
         
-        log_splitter.addWidget(log_group)
-        log_splitter.setStretchFactor(0, 1)
-        log_splitter.setStretchFactor(1, 0)
+        self.log_splitter.addWidget(log_group)
+        self.log_splitter.setStretchFactor(0, 1)
+        self.log_splitter.setStretchFactor(1, 0)
         
-        main_layout.addWidget(log_splitter)
+        main_layout.addWidget(self.log_splitter)
     
     def create_overview_tab(self):
         """Create the overview tab."""
@@ -159,20 +338,17 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(overview_widget)
         
         # Environment info
-        env_group = QGroupBox("Current Environment")
-        env_layout = QFormLayout(env_group)
-        
         self.env_name_label = QLabel("Not connected")
         self.env_url_label = QLabel("Not connected")
         self.env_region_label = QLabel("Not connected")
         self.env_type_label = QLabel("Not connected")
         
-        env_layout.addRow("Name:", self.env_name_label)
-        env_layout.addRow("URL:", self.env_url_label)
-        env_layout.addRow("Region:", self.env_region_label)
-        env_layout.addRow("Type:", self.env_type_label)
-        
-        layout.addWidget(env_group)
+        layout.addWidget(_form_group("Current Environment", (
+            ("Name:", self.env_name_label),
+            ("URL:", self.env_url_label),
+            ("Region:", self.env_region_label),
+            ("Type:", self.env_type_label),
+        )))
         
         # Quick actions
         actions_group = QGroupBox("Quick Actions")
@@ -191,6 +367,35 @@ class MainWindow(QMainWindow):
         
         self.tab_widget.addTab(overview_widget, "Overview")
     
+    @Slot(int)
+    def on_tab_changed(self, index: int):
+        """Build a lazily created tab the first time it is selected."""
+        
+        self.ensure_tab(index)
+    
+    def ensure_tab(self, index: int):
+        """Replace a tab's placeholder with the real widget if not built yet."""
+        
+        factory = self._tab_factories.pop(index, None)
+        if factory is None:
+            return
+        
+        title = self.tab_widget.tabText(index)
+        current = self.tab_widget.currentIndex()
+        placeholder = self.tab_widget.widget(index)
+        built_widget = factory()
+        
+        # Swapping tabs changes the current index; keep that quiet
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, built_widget, title)
+            self.tab_widget.setCurrentIndex(current)
+        finally:
+            self.tab_widget.blockSignals(False)
+        
+        placeholder.deleteLater()
+    
     def create_solutions_tab(self):
         """Create the solutions management tab."""
         
@@ -198,9 +403,8 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(solutions_widget)
         
         # Solutions table
-        self.solutions_table = QTableWidget()
-        self.solutions_table.setColumnCount(4)
-        self.solutions_table.setHorizontalHeaderLabels(["Name", "Display Name", "Version", "Managed"])
+        self.solutions_table = QTableView()
+        self.solutions_table.setModel(self.solutions_model)
         layout.addWidget(self.solutions_table)
         
         # Buttons
@@ -217,7 +421,7 @@ class MainWindow(QMainWindow):
         button_layout.addStretch()
         layout.addLayout(button_layout)
         
-        self.tab_widget.addTab(solutions_widget, "Solutions")
+        return solutions_widget
     
     def create_import_export_tab(self):
         """Create the import/export tab."""
@@ -226,57 +430,40 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(import_export_widget)
         
         # Import section
-        import_group = QGroupBox("Import Solution")
-        import_layout = QFormLayout(import_group)
-        
         self.import_path_edit = QLineEdit()
-        browse_btn = QPushButton("Browse...")
-        browse_btn.clicked.connect(self.browse_import_file)
-        
-        import_path_layout = QHBoxLayout()
-        import_path_layout.addWidget(self.import_path_edit)
-        import_path_layout.addWidget(browse_btn)
-        
-        import_layout.addRow("Solution File:", import_path_layout)
         
         self.publish_workflows_check = QCheckBox("Publish Workflows")
         self.publish_workflows_check.setChecked(True)
-        import_layout.addRow("Options:", self.publish_workflows_check)
         
         import_btn = QPushButton("Import Solution")
         import_btn.clicked.connect(self.import_solution)
-        import_layout.addRow(import_btn)
         
-        layout.addWidget(import_group)
+        layout.addWidget(_form_group("Import Solution", (
+            ("Solution File:", _browse_row(self.import_path_edit, self.browse_import_file)),
+            ("Options:", self.publish_workflows_check),
+            (None, import_btn),
+        )))
         
         # Export section
-        export_group = QGroupBox("Export Solution")
-        export_layout = QFormLayout(export_group)
-        
         self.export_solution_combo = QComboBox()
-        export_layout.addRow("Solution:", self.export_solution_combo)
-        
         self.export_path_edit = QLineEdit()
-        export_browse_btn = QPushButton("Browse...")
-        export_browse_btn.clicked.connect(self.browse_export_folder)
-        
-        export_path_layout = QHBoxLayout()
-        export_path_layout.addWidget(self.export_path_edit)
-        export_path_layout.addWidget(export_browse_btn)
-        
-        export_layout.addRow("Export Path:", export_path_layout)
-        
         self.managed_export_check = QCheckBox("Export as Managed")
-        export_layout.addRow("Options:", self.managed_export_check)
         
         export_btn = QPushButton("Export Solution")
         export_btn.clicked.connect(self.export_solution)
-        export_layout.addRow(export_btn)
         
-        layout.addWidget(export_group)
+        layout.addWidget(_form_group("Export Solution", (
+            ("Solution:", self.export_solution_combo),
+            ("Export Path:", _browse_row(self.export_path_edit, self.browse_export_folder)),
+            ("Options:", self.managed_export_check),
+            (None, export_btn),
+        )))
         layout.addStretch()
         
-        self.tab_widget.addTab(import_export_widget, "Import/Export")
+        # Solutions may have been loaded before this tab was built
+        self.populate_export_combo(self.solutions_model.solutions())
+        
+        return import_export_widget
     
     def create_logs_tab(self):
         """Create the logs tab."""
@@ -284,11 +471,16 @@ class MainWindow(QMainWindow):
         logs_widget = QWidget()
         layout = QVBoxLayout(logs_widget)
         
-        self.detailed_log_text = QTextEdit()
+        self.detailed_log_text = QPlainTextEdit()
         self.detailed_log_text.setReadOnly(True)
+        self.detailed_log_text.setMaximumBlockCount(LOG_MAX_LINES)
         self.detailed_log_text.setFont(QFont("Consolas", 9))
         layout.addWidget(self.detailed_log_text)
         
+        # Carry over what was logged before this tab was built
+        self.flush_log()
+        self.detailed_log_text.setPlainText(self.log_text.toPlainText())
+        
         # Log controls
         log_controls = QHBoxLayout()
         
@@ -303,7 +495,7 @@ class MainWindow(QMainWindow):
         log_controls.addStretch()
         layout.addLayout(log_controls)
         
-        self.tab_widget.addTab(logs_widget, "Logs")
+        return logs_widget
     
     def setup_menu_bar(self):
         """Set up the menu bar."""
@@ -313,27 +505,28 @@ class MainWindow(QMainWindow):
         # File menu
         file_menu = menubar.addMenu("File")
         
-        refresh_action = QAction("Refresh Environments", self)
+        refresh_action = QAction(_icon("refresh"), "Refresh Environments", self)
         refresh_action.triggered.connect(self.refresh_environments)
         file_menu.addAction(refresh_action)
+        self._refresh_controls.append(refresh_action)
         
         file_menu.addSeparator()
         
-        exit_action = QAction("Exit", self)
+        exit_action = QAction(_icon("exit"), "Exit", self)
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
         
         # Tools menu
         tools_menu = menubar.addMenu("Tools")
         
-        auth_action = QAction("Authenticate", self)
+        auth_action = QAction(_icon("authenticate"), "Authenticate", self)
         auth_action.triggered.connect(self.authenticate)
         tools_menu.addAction(auth_action)
         
         # Help menu
         help_menu = menubar.addMenu("Help")
         
-        about_action = QAction("About", self)
+        about_action = QAction(_icon("about"), "About", self)
         about_action.triggered.connect(self.show_about)
         help_menu.addAction(about_action)
     
@@ -341,19 +534,21 @@ class MainWindow(QMainWindow):
         """Set up the tool bar."""
         
         toolbar = self.addToolBar("Main")
+        toolbar.setObjectName("MainToolBar")  # Required by saveState()
         toolbar.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
         
-        refresh_action = QAction("Refresh", self)
+        refresh_action = QAction(_icon("refresh"), "Refresh", self)
         refresh_action.triggered.connect(self.refresh_environments)
         toolbar.addAction(refresh_action)
+        self._refresh_controls.append(refresh_action)
         
-        connect_action = QAction("Connect", self)
+        connect_action = QAction(_icon("connect"), "Connect", self)
         connect_action.triggered.connect(self.connect_to_environment)
         toolbar.addAction(connect_action)
         
         toolbar.addSeparator()
         
-        auth_action = QAction("Authenticate", self)
+        auth_action = QAction(_icon("authenticate"), "Authenticate", self)
         auth_action.triggered.connect(self.authenticate)
         toolbar.addAction(auth_action)
     
@@ -370,28 +565,61 @@ class MainWindow(QMainWindow):
     def setup_connections(self):
         """Set up signal connections."""
         
-        self.environment_combo.currentTextChanged.connect(self.on_environment_changed)
+        # Connect by explicit signature so Qt skips overload resolution
+        self.environment_combo.currentTextChanged[str].connect(self.on_environment_changed)
+        self.tab_widget.currentChanged[int].connect(self.on_tab_changed)
     
     def log_message(self, message: str):
-        """Add a message to the log displays."""
+        """Queue a message for the log displays."""
         
-        self.log_text.append(message)
-        self.detailed_log_text.append(message)
+        self._log_queue.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    @Slot()
+    def flush_log(self):
+        """Write queued log messages to the log displays in one batch."""
         
-        # Scroll to bottom
-        self.log_text.verticalScrollBar().setValue(
-            self.log_text.verticalScrollBar().maximum()
-        )
-        self.detailed_log_text.verticalScrollBar().setValue(
-            self.detailed_log_text.verticalScrollBar().maximum()
-        )
+        if not self._log_queue:
+            return
+        
+        text = "\n".join(self._log_queue)
+        self._log_queue.clear()
+        
+        for view in (self.log_text, self.detailed_log_text):
+            if view is None:
+                continue  # Logs tab not built yet
+            
+            # Only follow new output if the user has not scrolled up
+            scroll_bar = view.verticalScrollBar()
+            at_bottom = scroll_bar.value() >= scroll_bar.maximum()
+            
+            view.appendPlainText(text)
+            
+            if at_bottom:
+                scroll_bar.setValue(scroll_bar.maximum())
     
     def set_status(self, message: str):
         """Set the status bar message."""
         
-        self.status_label.setText(message)
+        self.queue_status(message)
         self.log_message(f"Status: {message}")
     
+    def queue_status(self, message: str):
+        """Show a status message once control returns to the event loop."""
+        
+        if self._pending_status is None:
+            QTimer.singleShot(0, self.flush_status)
+        self._pending_status = message
+    
+    @Slot()
+    def flush_status(self):
+        """Apply the most recent queued status message."""
+        
+        if self._pending_status is not None:
+            self.status_label.setText(self._pending_status)
+            self._pending_status = None
+    
     def show_progress(self, show: bool = True):
         """Show or hide the progress bar."""
         
@@ -399,37 +627,91 @@ class MainWindow(QMainWindow):
         if show:
             self.progress_bar.setRange(0, 0)  # Indeterminate progress
     
+    def start_task(self, task: WorkerTask, priority: int = USER_PRIORITY, pool: Optional[QThreadPool] = None):
+        """Submit a background task, keeping it referenced until it completes."""
+        
+        task.signals.error.connect(self.on_worker_error)
+        task.signals.done.connect(self.on_task_done)
+        self._active_tasks[task.signals] = task
+        (pool or self.io_pool).start(task, priority)
+    
+    @Slot()
+    def on_task_done(self):
+        """Release a completed background task."""
+        
+        self._active_tasks.pop(self.sender(), None)
+    
+    @Slot()
     def refresh_environments(self):
-        """Refresh the list of environments."""
+        """Refresh the list of environments, coalescing rapid repeats."""
+        
+        if 'refresh' in self._inflight:
+            return
+        
+        # Restarting the timer folds repeated clicks into a single refresh
+        self._refresh_timer.start()
+    
+    @Slot()
+    def start_refresh(self):
+        """Start a refresh unless one is already running."""
+        
+        if 'refresh' in self._inflight:
+            return
+        
+        self._inflight.add('refresh')
+        self.set_refresh_enabled(False)
         
         self.set_status("Refreshing environments...")
         self.show_progress(True)
         
         def refresh_worker():
-            return self.environment_manager.refresh_environments()
+            # Run the PAC CLI call on this worker thread's own event loop
+            return asyncio.run(self.environment_manager.refresh_environments_async())
+        
+        task = WorkerTask(refresh_worker)
+        task.signals.finished.connect(self.on_environments_refreshed)
+        # Runs after either the result or the error has been handled
+        task.signals.done.connect(self.on_refresh_done)
+        self.start_task(task, BACKGROUND_PRIORITY)
+    
+    @Slot()
+    def on_refresh_done(self):
+        """Allow refreshes again once the running one has finished."""
+        
+        self._inflight.discard('refresh')
+        self.set_refresh_enabled(True)
+    
+    def set_refresh_enabled(self, enabled: bool):
+        """Enable or disable every control that starts a refresh."""
         
-        self.worker = WorkerThread(refresh_worker)
-        self.worker.finished.connect(self.on_environments_refreshed)
-        self.worker.error.connect(self.on_worker_error)
-        self.worker.start()
+        for control in self._refresh_controls:
+            control.setEnabled(enabled)
     
+    @Slot(object)
     def on_environments_refreshed(self, success: bool):
         """Handle environments refresh completion."""
         
         self.show_progress(False)
         
         if success:
-            self.environment_combo.clear()
             environments = self.environment_manager.get_environments()
             
+            items = []
             for env in environments:
-                self.environment_combo.addItem(env.display_name, env)
+                item = QStandardItem(env.display_name)
+                item.setData(env, Qt.UserRole)
+                items.append(item)
+            
+            # One reset and one insertion instead of a signal per environment
+            self._env_model.clear()
+            self._env_model.invisibleRootItem().appendRows(items)
             
             self.set_status(f"Found {len(environments)} environments")
         else:
             self.set_status("Failed to refresh environments")
             QMessageBox.warning(self, "Warning", "Failed to refresh environments")
     
+    @Slot(str)
     def on_environment_changed(self, text: str):
         """Handle environment selection change."""
         
@@ -437,6 +719,7 @@ class MainWindow(QMainWindow):
         if isinstance(current_data, PowerPlatformEnvironment):
             self.current_environment = current_data
     
+    @Slot()
     def connect_to_environment(self):
         """Connect to the selected environment."""
         
@@ -450,11 +733,11 @@ class MainWindow(QMainWindow):
         def connect_worker():
             return self.environment_manager.select_environment(self.current_environment)
         
-        self.worker = WorkerThread(connect_worker)
-        self.worker.finished.connect(self.on_environment_connected)
-        self.worker.error.connect(self.on_worker_error)
-        self.worker.start()
+        task = WorkerTask(connect_worker)
+        task.signals.finished.connect(self.on_environment_connected)
+        self.start_task(task, USER_PRIORITY)
     
+    @Slot(object)
     def on_environment_connected(self, success: bool):
         """Handle environment connection completion."""
         
@@ -476,6 +759,7 @@ class MainWindow(QMainWindow):
             self.env_region_label.setText(self.current_environment.region)
             self.env_type_label.setText(self.current_environment.environment_type)
     
+    @Slot()
     def authenticate(self):
         """Authenticate with Power Platform."""
         
@@ -485,11 +769,11 @@ class MainWindow(QMainWindow):
         def auth_worker():
             return self.pac_cli.authenticate()
         
-        self.worker = WorkerThread(auth_worker)
-        self.worker.finished.connect(self.on_authentication_complete)
-        self.worker.error.connect(self.on_worker_error)
-        self.worker.start()
+        task = WorkerTask(auth_worker)
+        task.signals.finished.connect(self.on_authentication_complete)
+        self.start_task(task, USER_PRIORITY)
     
+    @Slot(object)
     def on_authentication_complete(self, success: bool):
         """Handle authentication completion."""
         
@@ -502,6 +786,7 @@ class MainWindow(QMainWindow):
             self.set_status("Authentication failed")
             QMessageBox.warning(self, "Warning", "Authentication failed")
     
+    @Slot()
     def list_solutions(self):
         """List solutions in the current environment."""
         
@@ -515,30 +800,44 @@ class MainWindow(QMainWindow):
         def solutions_worker():
             return self.pac_cli.get_solutions()
         
-        self.worker = WorkerThread(solutions_worker)
-        self.worker.finished.connect(self.on_solutions_loaded)
-        self.worker.error.connect(self.on_worker_error)
-        self.worker.start()
+        task = WorkerTask(solutions_worker)
+        task.signals.finished.connect(self.on_solutions_loaded)
+        self.start_task(task, USER_PRIORITY)
     
+    @Slot(object)
     def on_solutions_loaded(self, solutions: List[Dict[str, Any]]):
         """Handle solutions list completion."""
         
         self.show_progress(False)
         
-        self.solutions_table.setRowCount(len(solutions))
-        self.export_solution_combo.clear()
+        # The table view reads rows straight from the model; one reset
+        # replaces the per-cell item construction
+        self.solutions_model.set_solutions(solutions)
         
-        for i, solution in enumerate(solutions):
-            self.solutions_table.setItem(i, 0, QTableWidgetItem(solution.get('UniqueName', '')))
-            self.solutions_table.setItem(i, 1, QTableWidgetItem(solution.get('FriendlyName', '')))
-            self.solutions_table.setItem(i, 2, QTableWidgetItem(solution.get('Version', '')))
-            self.solutions_table.setItem(i, 3, QTableWidgetItem(str(solution.get('IsManaged', False))))
-            
-            # Add to export combo
-            self.export_solution_combo.addItem(solution.get('FriendlyName', ''), solution.get('UniqueName', ''))
+        if self.export_solution_combo is not None:
+            self.populate_export_combo(solutions)
         
         self.set_status(f"Loaded {len(solutions)} solutions")
     
+    def populate_export_combo(self, solutions: List[Dict[str, Any]]):
+        """Rebuild the export solution combo with signals suspended."""
+        
+        combo = self.export_solution_combo
+        combo.blockSignals(True)
+        
+        try:
+            combo.clear()
+            
+            # Bind lookups once; each attribute access crosses into the Qt bindings
+            add_export = combo.addItem
+            get = dict.get
+            
+            for solution in solutions:
+                add_export(get(solution, 'FriendlyName', ''), get(solution, 'UniqueName', ''))
+        finally:
+            combo.blockSignals(False)
+    
+    @Slot()
     def browse_import_file(self):
         """Browse for import file."""
         
@@ -552,6 +851,7 @@ class MainWindow(QMainWindow):
         if file_path:
             self.import_path_edit.setText(file_path)
     
+    @Slot()
     def browse_export_folder(self):
         """Browse for export folder."""
         
@@ -563,6 +863,7 @@ class MainWindow(QMainWindow):
         if folder_path:
             self.export_path_edit.setText(folder_path)
     
+    @Slot()
     def import_solution(self):
         """Import a solution."""
         
@@ -579,13 +880,20 @@ class MainWindow(QMainWindow):
         self.show_progress(True)
         
         def import_worker():
-            return self.pac_cli.import_solution(file_path, self.publish_workflows_check.isChecked())
-        
-        self.worker = WorkerThread(import_worker)
-        self.worker.finished.connect(self.on_import_complete)
-        self.worker.error.connect(self.on_worker_error)
-        self.worker.start()
+            return self.pac_cli.import_solution(
+                file_path,
+                self.publish_workflows_check.isChecked(),
+                on_progress=lambda received: task.signals.progress.emit(
+                    f"Importing solution... {format_file_size(received)} of output received"
+                )
+            )
+        
+        task = WorkerTask(import_worker)
+        task.signals.progress.connect(self.on_worker_progress)
+        task.signals.finished.connect(self.on_import_complete)
+        self.start_task(task, USER_PRIORITY)
     
+    @Slot(object)
     def on_import_complete(self, success: bool):
         """Handle import completion."""
         
@@ -598,9 +906,14 @@ class MainWindow(QMainWindow):
             self.set_status("Solution import failed")
             QMessageBox.warning(self, "Warning", "Solution import failed")
     
+    @Slot()
     def export_solution(self):
         """Export a solution."""
         
+        # Export can be started from the Solutions tab before the
+        # Import/Export tab holding the export options has been built
+        self.ensure_tab(IMPORT_EXPORT_TAB)
+        
         solution_name = self.export_solution_combo.currentData()
         export_path = self.export_path_edit.text()
         
@@ -620,13 +933,21 @@ class MainWindow(QMainWindow):
         self.show_progress(True)
         
         def export_worker():
-            return self.pac_cli.export_solution(solution_name, export_path, self.managed_export_check.isChecked())
-        
-        self.worker = WorkerThread(export_worker)
-        self.worker.finished.connect(self.on_export_complete)
-        self.worker.error.connect(self.on_worker_error)
-        self.worker.start()
+            return self.pac_cli.export_solution(
+                solution_name,
+                export_path,
+                self.managed_export_check.isChecked(),
+                on_progress=lambda received: task.signals.progress.emit(
+                    f"Exporting solution... {format_file_size(received)} of output received"
+                )
+            )
+        
+        task = WorkerTask(export_worker)
+        task.signals.progress.connect(self.on_worker_progress)
+        task.signals.finished.connect(self.on_export_complete)
+        self.start_task(task, USER_PRIORITY)
     
+    @Slot(object)
     def on_export_complete(self, success: bool):
         """Handle export completion."""
         
@@ -639,6 +960,13 @@ class MainWindow(QMainWindow):
             self.set_status("Solution export failed")
             QMessageBox.warning(self, "Warning", "Solution export failed")
     
+    @Slot(str)
+    def on_worker_progress(self, message: str):
+        """Handle worker thread progress updates."""
+        
+        self.queue_status(message)
+    
+    @Slot(str)
     def on_worker_error(self, error_message: str):
         """Handle worker thread errors."""
         
@@ -646,12 +974,15 @@ class MainWindow(QMainWindow):
         self.set_status(f"Error: {error_message}")
         QMessageBox.critical(self, "Error", error_message)
     
+    @Slot()
     def clear_logs(self):
         """Clear the log displays."""
         
+        self._log_queue.clear()
         self.log_text.clear()
         self.detailed_log_text.clear()
     
+    @Slot()
     def save_logs(self):
         """Save logs to file."""
         
@@ -662,14 +993,38 @@ class MainWindow(QMainWindow):
             "Text Files (*.txt);;All Files (*)"
         )
         
-        if file_path:
+        if not file_path:
+            return
+        
+        self.flush_log()
+        
+        # Documents must not be read off the UI thread, so the text is taken
+        # here; the view is capped at LOG_MAX_LINES lines, which keeps this
+        # copy small, and the worker only writes the finished string
+        log_text = self.detailed_log_text.toPlainText()
+        
+        def save_worker():
             try:
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(self.detailed_log_text.toPlainText())
-                QMessageBox.information(self, "Success", "Logs saved successfully")
-            except Exception as e:
-                QMessageBox.warning(self, "Error", f"Failed to save logs: {str(e)}")
+                    f.write(log_text)
+            except OSError as e:
+                raise OSError(f"Failed to save logs: {e}") from e
+            return file_path
+        
+        self.set_status("Saving logs...")
+        
+        task = WorkerTask(save_worker)
+        task.signals.finished.connect(self.on_logs_saved)
+        self.start_task(task, USER_PRIORITY)
+    
+    @Slot(object)
+    def on_logs_saved(self, file_path: str):
+        """Handle log save completion."""
+        
+        self.set_status(f"Logs saved to {file_path}")
+        QMessageBox.information(self, "Success", "Logs saved successfully")
     
+    @Slot()
     def show_about(self):
         """Show about dialog."""
         
@@ -682,13 +1037,64 @@ class MainWindow(QMainWindow):
             "Built with Python and PySide6"
         )
     
+    def remembers_layout(self) -> bool:
+        """Check whether the window layout should persist between sessions."""
+        
+        return self.ui_config.remember_size or self.ui_config.remember_position
+    
+    def restore_window_state(self):
+        """Restore the window layout saved by the previous session."""
+        
+        if not self.remembers_layout():
+            return
+        
+        geometry = self._settings.value("geometry")
+        if geometry:
+            self.restoreGeometry(geometry)
+        
+        window_state = self._settings.value("windowState")
+        if window_state:
+            self.restoreState(window_state)
+        
+        splitter_state = self._settings.value("splitter")
+        if splitter_state:
+            self.log_splitter.restoreState(splitter_state)
+        
+        self.tab_widget.setCurrentIndex(self._settings.value("currentTab", 0, type=int))
+    
+    def save_window_state(self):
+        """Save the window layout as Qt's binary state blobs."""
+        
+        self._settings.setValue("geometry", self.saveGeometry())
+        self._settings.setValue("windowState", self.saveState())
+        self._settings.setValue("splitter", self.log_splitter.saveState())
+        self._settings.setValue("currentTab", self.tab_widget.currentIndex())
+    
     def closeEvent(self, event):
         """Handle window close event."""
         
         # Save window geometry if configured
-        if self.config.get("ui", {}).get("remember_size", True):
-            size = self.size()
-            self.config["ui"]["window_width"] = size.width()
-            self.config["ui"]["window_height"] = size.height()
+        if self.remembers_layout():
+            self.save_window_state()
         
+        self.shutdown()
         event.accept()
+    
+    def shutdown(self):
+        """Stop timers and background work so the window tears down quickly."""
+        
+        self._log_timer.stop()
+        self._refresh_timer.stop()
+        
+        self.environment_combo.currentTextChanged[str].disconnect(self.on_environment_changed)
+        self.tab_widget.currentChanged[int].disconnect(self.on_tab_changed)
+        
+        # Tasks still running finish on their own, but must not call back
+        # into a window that is closing
+        for signals in self._active_tasks:
+            signals.blockSignals(True)
+        
+        # Drop queued tasks and give running ones a moment to finish
+        for pool in (self.io_pool, self.cpu_pool):
+            pool.clear()
+            pool.waitForDone(SHUTDOWN_WAIT_MS)
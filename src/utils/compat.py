@@ -0,0 +1,12 @@
+"""
+Python Version Compatibility
+
+This module holds flags for language features that depend on the running
+Python version, shared by the core and UI packages.
+"""
+
+import sys
+
+
+# dataclass(slots=True) is only available from Python 3.10
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -5,62 +5,214 @@ This module contains utility functions used throughout the application.
 """
 
 import os
-import json
+import atexit
+import copy
+import functools
+import stat
 import logging
-import logging.handlers
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional, Set, Tuple, Union
 
+from utils.compat import DATACLASS_SLOTS
 
-def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> None:
+
+# JSON parsers, queue and logging.handlers are imported where they are
+# used, so importing this module stays cheap for callers that only need a helper
+if TYPE_CHECKING:
+    from logging.handlers import QueueListener
+
+
+# Default locations, relative to the working directory
+_LOG_DIR = Path("logs")
+_LOG_FILE = str(_LOG_DIR / "power_platform_utility.log")
+_DEFAULT_CONFIG_PATH = Path("config") / "settings.json"
+
+# Arguments of the last setup_logging call, used to skip identical repeats
+_LOGGING_STATE: Optional[Tuple[str, Optional[str]]] = None
+
+# Log record format, shared by the console and file handlers
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+_FMT = logging.Formatter(_LOG_FORMAT, _DATE_FORMAT)
+
+# Log levels accepted by setup_logging
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Background listener writing queued records to the log file
+_LOG_LISTENER: Optional["QueueListener"] = None
+
+# Default configuration; copied, never handed out directly
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "application": {
+        "name": "Power Platform Utility",
+        "version": "1.0.0",
+        "theme": "default"
+    },
+    "pac_cli": {
+        "timeout": 30,
+        "retry_attempts": 3
+    },
+    "ui": {
+        "window_width": 1200,
+        "window_height": 800,
+        "remember_size": True,
+        "remember_position": True
+    },
+    "logging": {
+        "level": "INFO",
+        "file_logging": True
+    }
+}
+
+# Parsed configuration files, by path, with the modification time they were read at
+_CONFIG_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+# Configuration paths known not to exist; cleared for a path when it is saved
+_MISSING_CONFIG_PATHS: Set[str] = set()
+
+# Characters not allowed in Windows filenames, all mapped to underscores
+_SANITIZE_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
+# Characters stripped from both ends of a sanitized filename
+_STRIP_CHARS = ' .'
+
+# File size units, each 1024 times the previous one
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Directories this process has already created or found to exist
+_KNOWN_DIRS: Set[str] = set()
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class UIConfig:
+    """Typed view of the "ui" configuration section."""
+    window_width: int = 1200
+    window_height: int = 800
+    remember_size: bool = True
+    remember_position: bool = True
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'UIConfig':
+        """Build from an application config, ignoring unknown "ui" keys."""
+        ui_config = config.get("ui", {})
+        return cls(**{f.name: ui_config[f.name] for f in fields(cls) if f.name in ui_config})
+
+
+@functools.lru_cache(maxsize=None)
+def _json_loader():
+    """Get the fastest available JSON parser, importing it on first use."""
+    try:
+        from orjson import loads
+    except ImportError:
+        from json import loads
+    return loads
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory and its parents, once per process."""
+    key = str(path)
+    if key not in _KNOWN_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _KNOWN_DIRS.add(key)
+
+
+def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None, force: bool = False) -> None:
     """
     Set up application logging configuration.
     
+    Calling this again with the same arguments keeps the existing handlers.
+    
     Args:
-        log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL);
+            unrecognized levels fall back to INFO
         log_file: Optional log file path
+        force: Reconfigure even if already set up with the same arguments
+    
+    File logging goes through a queue drained by a background thread, so
+    logging calls do not wait on disk writes. Records still queued when
+    the process crashes are lost.
+    
+    At WARNING and above (production use), records skip collecting thread
+    and process details, and errors raised inside handlers are not printed.
     """
+    global _LOGGING_STATE, _LOG_LISTENER
+    
+    state = (log_level, log_file)
+    if not force and _LOGGING_STATE == state:
+        return
+    
+    import queue
+    from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
     
     # Create logs directory if it doesn't exist
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
+    _ensure_dir(_LOG_DIR)
+    
+    level = _LEVELS.get(log_level.upper(), logging.INFO)
     
-    # Configure logging format
-    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    date_format = '%Y-%m-%d %H:%M:%S'
+    # The log format uses no thread or process fields, so only pay for
+    # collecting them while debugging
+    detailed = level < logging.WARNING
+    logging.logThreads = detailed
+    logging.logProcesses = detailed
+    logging.logMultiprocessing = detailed
+    logging.raiseExceptions = detailed
     
     # Set up root logger
     logger = logging.getLogger()
-    logger.setLevel(getattr(logging, log_level.upper()))
+    logger.setLevel(level)
     
     # Clear existing handlers
     logger.handlers.clear()
     
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, log_level.upper()))
-    console_formatter = logging.Formatter(log_format, date_format)
-    console_handler.setFormatter(console_formatter)
+    console_handler.setLevel(level)
+    console_handler.setFormatter(_FMT)
     logger.addHandler(console_handler)
     
-    # File handler
-    if log_file:
-        file_path = Path(log_file)
-    else:
-        file_path = log_dir / "power_platform_utility.log"
-    
-    file_handler = logging.handlers.RotatingFileHandler(
-        file_path,
+    # File handler; it takes the path as a string, so no Path is needed
+    file_handler = RotatingFileHandler(
+        log_file or _LOG_FILE,
         maxBytes=10*1024*1024,  # 10MB
         backupCount=5
     )
     file_handler.setLevel(logging.DEBUG)
-    file_formatter = logging.Formatter(log_format, date_format)
-    file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    file_handler.setFormatter(_FMT)
+    
+    # Replace any listener left by a previous configuration
+    _stop_log_listener()
+    
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    
+    _LOG_LISTENER = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _LOG_LISTENER.start()
+    
+    _LOGGING_STATE = state
 
 
-def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
+@atexit.register
+def _stop_log_listener() -> None:
+    """Flush queued log records to the file and close it."""
+    global _LOG_LISTENER
+    
+    if _LOG_LISTENER is None:
+        return
+    
+    _LOG_LISTENER.stop()
+    for handler in _LOG_LISTENER.handlers:
+        handler.close()
+    _LOG_LISTENER = None
+
+
+def load_config(config_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
     """
     Load application configuration from JSON file.
     
@@ -68,76 +220,109 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         config_path: Path to configuration file
         
     Returns:
-        Dictionary containing configuration settings
+        Dictionary containing configuration settings; a fresh copy the
+        caller is free to modify
     """
     
     if config_path is None:
-        config_path = Path("config") / "settings.json"
-    else:
+        config_path = _DEFAULT_CONFIG_PATH
+    elif not isinstance(config_path, Path):
         config_path = Path(config_path)
     
-    # Default configuration
-    default_config = {
-        "application": {
-            "name": "Power Platform Utility",
-            "version": "1.0.0",
-            "theme": "default"
-        },
-        "pac_cli": {
-            "timeout": 30,
-            "retry_attempts": 3
-        },
-        "ui": {
-            "window_width": 1200,
-            "window_height": 800,
-            "remember_size": True,
-            "remember_position": True
-        },
-        "logging": {
-            "level": "INFO",
-            "file_logging": True
-        }
-    }
-    
     # Load configuration from file if it exists
-    if config_path.exists():
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                file_config = json.load(f)
-                # Merge with default config
-                default_config.update(file_config)
-        except (json.JSONDecodeError, IOError) as e:
-            logging.warning(f"Failed to load config file {config_path}: {e}")
+    path_key = str(config_path)
+    if path_key in _MISSING_CONFIG_PATHS:
+        return copy.deepcopy(_DEFAULT_CONFIG)
+    
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except FileNotFoundError:
+        _MISSING_CONFIG_PATHS.add(path_key)
+        return copy.deepcopy(_DEFAULT_CONFIG)
+    except OSError:
+        return copy.deepcopy(_DEFAULT_CONFIG)
     
-    return default_config
+    # Reuse the parsed file until it is modified
+    cached = _CONFIG_CACHE.get(path_key)
+    if cached is not None and cached[0] == mtime_ns:
+        return copy.deepcopy(cached[1])
+    
+    default_config = copy.deepcopy(_DEFAULT_CONFIG)
+    
+    try:
+        # Settings files are small; read in one go and parse the bytes
+        file_config = _json_loader()(config_path.read_bytes())
+        
+        # Merge with default config section by section, so a file that sets
+        # only some keys of a section keeps the defaults for the others
+        for key, value in file_config.items():
+            section = default_config.get(key)
+            if isinstance(value, dict) and isinstance(section, dict):
+                section.update(value)
+            else:
+                default_config[key] = value
+    except (ValueError, IOError) as e:
+        logging.warning(f"Failed to load config file {config_path}: {e}")
+        return default_config
+    
+    _CONFIG_CACHE[path_key] = (mtime_ns, default_config)
+    return copy.deepcopy(default_config)
 
 
-def save_config(config: Dict[str, Any], config_path: Optional[str] = None) -> bool:
+def save_config(config: Dict[str, Any], config_path: Optional[Union[str, Path]] = None,
+                durable: bool = True) -> bool:
     """
     Save application configuration to JSON file.
     
+    The file is written to a temporary file first and then moved into
+    place, so an interrupted save never leaves a truncated config behind.
+    
     Args:
         config: Configuration dictionary to save
         config_path: Path to configuration file
+        durable: Flush the file to disk before replacing the old one; pass
+            False for frequent saves where losing the latest one on a
+            power failure is acceptable
         
     Returns:
         True if successful, False otherwise
     """
     
     if config_path is None:
-        config_path = Path("config") / "settings.json"
-    else:
+        config_path = _DEFAULT_CONFIG_PATH
+    elif not isinstance(config_path, Path):
         config_path = Path(config_path)
     
     # Ensure config directory exists
-    config_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(config_path.parent)
+    
+    # The file is about to change, so the next load must read it again;
+    # mtime alone can miss a rewrite within the filesystem's timestamp
+    # granularity
+    path_key = str(config_path)
+    _MISSING_CONFIG_PATHS.discard(path_key)
+    _CONFIG_CACHE.pop(path_key, None)
+    
+    tmp_path = config_path.with_name(config_path.name + ".tmp")
     
     try:
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=4)
+        import json
+        
+        # Serialize up front so the file gets a single write
+        data = json.dumps(config, indent=2)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, config_path)
         return True
     except IOError as e:
         logging.error(f"Failed to save config file {config_path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
         return False
 
 
@@ -155,13 +340,14 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB"]
+    # Every unit is 2**10 times the previous one, so the unit index follows
+    # from the bit length; anything below 1 KB, including negative sizes,
+    # stays in bytes
     i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
+    if size_bytes >= 1024:
+        i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
     
-    return f"{size_bytes:.1f} {size_names[i]}"
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
 
 
 def validate_file_path(file_path: str) -> bool:
@@ -175,10 +361,10 @@ def validate_file_path(file_path: str) -> bool:
         True if valid, False otherwise
     """
     
+    # One stat answers both "exists" and "is a regular file"
     try:
-        path = Path(file_path)
-        return path.exists() and path.is_file()
-    except Exception:
+        return stat.S_ISREG(os.stat(file_path).st_mode)
+    except (OSError, TypeError, ValueError):
         return False
 
 
@@ -193,10 +379,10 @@ def validate_directory_path(dir_path: str) -> bool:
         True if valid, False otherwise
     """
     
+    # One stat answers both "exists" and "is a directory"
     try:
-        path = Path(dir_path)
-        return path.exists() and path.is_dir()
-    except Exception:
+        return stat.S_ISDIR(os.stat(dir_path).st_mode)
+    except (OSError, TypeError, ValueError):
         return False
 
 
@@ -211,26 +397,18 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     
-    # Characters not allowed in Windows filenames
-    invalid_chars = '<>:"/\\|?*'
-    
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    
-    # Remove leading/trailing spaces and dots
-    filename = filename.strip(' .')
-    
-    # Ensure filename is not empty
-    if not filename:
-        filename = "untitled"
-    
-    return filename
+    # Replace invalid characters in a single pass, remove leading/trailing
+    # spaces and dots, and ensure the filename is not empty
+    return filename.translate(_SANITIZE_TABLE).strip(_STRIP_CHARS) or "untitled"
 
 
+@functools.lru_cache(maxsize=None)
 def get_app_data_dir() -> Path:
     """
     Get the application data directory.
     
+    The result is computed once per process.
+    
     Returns:
         Path to application data directory
     """
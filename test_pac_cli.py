@@ -8,6 +8,7 @@ This script tests the PAC CLI wrapper functionality without launching the full G
 import sys
 import os
 from pathlib import Path
+from typing import Optional
 
 # Add src to Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
@@ -16,18 +17,29 @@ from core.pac_cli import PACCLIWrapper, PACCLIError
 from core.environment import EnvironmentManager
 from utils.helpers import setup_logging
 
-def test_pac_cli_basic():
+def create_pac_cli() -> Optional[PACCLIWrapper]:
+    """Create the PAC CLI wrapper shared by the tests, or None if unavailable."""
+    try:
+        pac_cli = PACCLIWrapper()
+        print("✓ PAC CLI wrapper initialized successfully")
+        return pac_cli
+    except PACCLIError as e:
+        print(f"✗ PAC CLI Error: {str(e)}")
+        return None
+
+def test_pac_cli_basic(pac_cli: Optional[PACCLIWrapper] = None):
     """Test basic PAC CLI functionality."""
     print("Testing PAC CLI basic functionality...")
     
     try:
-        pac_cli = PACCLIWrapper()
-        print("✓ PAC CLI wrapper initialized successfully")
+        # Create a wrapper only when run on its own, e.g. under pytest
+        if pac_cli is None:
+            pac_cli = PACCLIWrapper()
         
         # Test a simple command
         result = pac_cli.run_command(["--version"])
         if result["success"]:
-            print(f"✓ PAC CLI version: {result['stdout'].strip()}")
+            print(f"✓ PAC CLI version: {result['stdout'].decode().strip()}")
         else:
             print(f"✗ Failed to get PAC CLI version: {result['stderr']}")
             return False
@@ -41,12 +53,13 @@ def test_pac_cli_basic():
         print(f"✗ Unexpected error: {str(e)}")
         return False
 
-def test_environment_manager():
+def test_environment_manager(pac_cli: Optional[PACCLIWrapper] = None):
     """Test environment manager functionality."""
     print("\nTesting Environment Manager...")
     
     try:
-        pac_cli = PACCLIWrapper()
+        if pac_cli is None:
+            pac_cli = PACCLIWrapper()
         env_manager = EnvironmentManager(pac_cli)
         print("✓ Environment manager initialized successfully")
         
@@ -98,19 +111,29 @@ def main():
     print("Power Platform Utility - Integration Test")
     print("=" * 50)
     
+    # Probe for PAC CLI once; the tests that need it share the wrapper
+    print("\n--- PAC CLI Wrapper ---")
+    pac_cli = create_pac_cli()
+    
     tests = [
-        ("PAC CLI Basic", test_pac_cli_basic),
-        ("Environment Manager", test_environment_manager),
-        ("Configuration", test_configuration),
-        ("Logging", test_logging)
+        ("PAC CLI Basic", test_pac_cli_basic, True),
+        ("Environment Manager", test_environment_manager, True),
+        ("Configuration", test_configuration, False),
+        ("Logging", test_logging, False)
     ]
     
     passed = 0
     total = len(tests)
     
-    for test_name, test_func in tests:
+    for test_name, test_func, needs_pac_cli in tests:
         print(f"\n--- {test_name} ---")
-        if test_func():
+        if not needs_pac_cli:
+            if test_func():
+                passed += 1
+        elif pac_cli is None:
+            # Construction already failed; don't probe for PAC CLI again
+            print("✗ Skipped: PAC CLI wrapper unavailable")
+        elif test_func(pac_cli):
             passed += 1
     
     print("\n" + "=" * 50)
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Test script for PAC CLI concurrency limits
+
+This script checks the process-wide command cap and state lock of the PAC CLI
+wrapper. PAC CLI itself is not needed: commands are replaced by short sleeps.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add src to Python path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+# The wrapper is only used for its locking, so skip looking for PAC CLI
+os.environ["POWER_PLATFORM_SKIP_PAC_CHECK"] = "1"
+
+from core.pac_cli import PACCLIWrapper, _MAX_PARALLEL_COMMANDS
+
+# How long each stand-in command runs, in seconds
+COMMAND_SECONDS = 0.2
+
+
+class CommandRecorder:
+    """Stand-in for spawning PAC CLI that records how many commands overlap."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+    
+    async def __call__(self, full_command: List[str], timeout: int, on_progress: Any) -> Dict[str, Any]:
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(COMMAND_SECONDS)
+        finally:
+            with self._lock:
+                self.running -= 1
+        return {
+            "success": True,
+            "stdout": b"[]",
+            "stderr": "",
+            "stderr_bytes": b"",
+            "returncode": 0,
+            "command": ' '.join(full_command)
+        }
+
+
+def create_pac_cli() -> PACCLIWrapper:
+    """Create a wrapper whose commands only sleep."""
+    pac_cli = PACCLIWrapper()
+    pac_cli._execute = CommandRecorder()
+    return pac_cli
+
+
+def run_in_threads(target, count: int) -> None:
+    """Run target on count threads at once and wait for all of them."""
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_command_cap_across_threads():
+    """Test that the command cap holds across threads and event loops."""
+    print("Testing the command cap across threads...")
+    
+    pac_cli = create_pac_cli()
+    
+    # Every thread runs its own event loop through the blocking wrapper
+    run_in_threads(lambda: pac_cli.run_command(["org", "list"]), _MAX_PARALLEL_COMMANDS + 2)
+    
+    max_running = pac_cli._execute.max_running
+    if max_running != _MAX_PARALLEL_COMMANDS:
+        print(f"✗ {max_running} commands ran at once, cap is {_MAX_PARALLEL_COMMANDS}")
+        return False
+    
+    print(f"✓ At most {_MAX_PARALLEL_COMMANDS} commands ran at once")
+    return True
+
+
+def test_writer_excludes_queries():
+    """Test that a state change never runs alongside a query."""
+    print("\nTesting state changes against queries...")
+    
+    pac_cli = create_pac_cli()
+    lock = threading.Lock()
+    state = {"readers": 0, "writer": False, "overlaps": 0}
+    
+    async def query():
+        async with pac_cli._reading_state():
+            with lock:
+                state["readers"] += 1
+                if state["writer"]:
+                    state["overlaps"] += 1
+            await asyncio.sleep(COMMAND_SECONDS)
+            with lock:
+                state["readers"] -= 1
+    
+    async def change():
+        async with pac_cli._changing_state():
+            with lock:
+                if state["readers"] or state["writer"]:
+                    state["overlaps"] += 1
+                state["writer"] = True
+            await asyncio.sleep(COMMAND_SECONDS)
+            with lock:
+                state["writer"] = False
+    
+    def worker(index: int):
+        # Interleave queries and changes from several threads
+        asyncio.run(change() if index % 3 == 0 else query())
+    
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(9)]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.02)
+    for thread in threads:
+        thread.join()
+    
+    if state["overlaps"]:
+        print(f"✗ State changes overlapped other commands {state['overlaps']} time(s)")
+        return False
+    
+    print("✓ State changes ran alone")
+    return True
+
+
+def test_cancelled_waiter_releases():
+    """Test that cancelling a waiting caller does not leave a lock held."""
+    print("\nTesting cancelled waiters...")
+    
+    pac_cli = create_pac_cli()
+    state_lock = pac_cli._state_lock
+    
+    # Hold the state lock from this thread so the waiter has to queue
+    state_lock.acquire_write()
+    
+    async def wait_briefly():
+        async def enter():
+            async with pac_cli._changing_state():
+                pass
+        
+        try:
+            await asyncio.wait_for(enter(), 0.1)
+        except asyncio.TimeoutError:
+            return True
+        return False
+    
+    timed_out = asyncio.run(wait_briefly())
+    state_lock.release_write()
+    
+    if not timed_out:
+        print("✗ The waiter acquired a lock that was held")
+        return False
+    
+    # The abandoned acquire completes on a waiter thread and must release
+    deadline = time.monotonic() + 2
+    while state_lock._writers_waiting and time.monotonic() < deadline:
+        time.sleep(0.01)
+    while not state_lock.acquire_write(blocking=False):
+        if time.monotonic() > deadline:
+            print("✗ The state lock stayed held after the waiter was cancelled")
+            return False
+        time.sleep(0.01)
+    state_lock.release_write()
+    
+    # The command slots must all be free again too
+    pac_cli.run_command(["org", "list"])
+    slots = pac_cli._process_slots
+    acquired = 0
+    while acquired < _MAX_PARALLEL_COMMANDS and slots.acquire(blocking=False):
+        acquired += 1
+    for _ in range(acquired):
+        slots.release()
+    
+    if acquired != _MAX_PARALLEL_COMMANDS:
+        print(f"✗ Only {acquired} of {_MAX_PARALLEL_COMMANDS} command slots were free")
+        return False
+    
+    print("✓ Cancelled waiters released the lock")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("Power Platform Utility - Concurrency Test")
+    print("=" * 50)
+    
+    tests = [
+        ("Command Cap", test_command_cap_across_threads),
+        ("State Lock", test_writer_excludes_queries),
+        ("Cancellation", test_cancelled_waiter_releases)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n--- {test_name} ---")
+        if test_func():
+            passed += 1
+    
+    print("\n" + "=" * 50)
+    print(f"Test Results: {passed}/{total} passed")
+    
+    if passed == total:
+        print("✓ All tests passed!")
+        return 0
+    else:
+        print(f"✗ {total - passed} test(s) failed. Please check the issues above.")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())